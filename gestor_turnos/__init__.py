@@ -0,0 +1,20 @@
+"""Gestor de turnos médicos: cola de atención con lista enlazada y planificador por triage"""
+# Este paquete NO importa tkinter: los scripts, simuladores o servicios que solo necesitan
+# la cola arrancan rápido y funcionan en una máquina sin pantalla.
+# La interfaz gráfica vive en gestor_turnos.interfaz y se carga recién cuando se pide.
+
+from .nucleo import Nodo, ListaEnlazadaTurnos
+from .prioridad import ColaPrioridadTurnos, NIVELES_TRIAGE, NIVEL_EMERGENCIA, NIVEL_NORMAL
+
+# GestorTurnosApp no va en __all__: "from gestor_turnos import *" cargaría tkinter
+__all__ = [
+    "Nodo", "ListaEnlazadaTurnos", "ColaPrioridadTurnos",
+    "NIVELES_TRIAGE", "NIVEL_EMERGENCIA", "NIVEL_NORMAL",
+]
+
+def __getattr__(nombre):
+    # Importación perezosa: gestor_turnos.GestorTurnosApp recién carga tkinter cuando alguien lo usa
+    if nombre == "GestorTurnosApp":
+        from .interfaz import GestorTurnosApp
+        return GestorTurnosApp
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
@@ -0,0 +1,78 @@
+"""Punto de entrada: python -m gestor_turnos [opciones]"""
+import argparse
+# Los simuladores y la interfaz se importan dentro de main() solo cuando se usan,
+# así por ejemplo --simular-carga nunca carga tkinter
+
+def crear_parser():
+    """Definir las opciones de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Sistema de Turnos Médicos")
+    parser.add_argument("--prioridad", action="store_true",
+                        help="usar el planificador por triage con envejecimiento en vez de la lista enlazada")
+    parser.add_argument("--simular-prioridad", type=int, metavar="PACIENTES", nargs="?", const=100_000,
+                        help="simular el planificador por prioridad sin abrir la interfaz")
+    parser.add_argument("--simular-carga", action="store_true",
+                        help="correr el simulador de carga por eventos discretos sin abrir la interfaz")
+    parser.add_argument("--dias", type=int, default=7, help="días de tráfico a simular")
+    parser.add_argument("--mostradores", type=int, default=2, help="puestos de recepción")
+    parser.add_argument("--medicos", type=int, nargs="+", default=[4, 5, 6, 7, 8],
+                        help="cantidades de médicos a comparar")
+    parser.add_argument("--llegadas-por-hora", type=float, nargs="+",
+                        help="tasa de llegadas (un valor fijo o 24 valores, uno por hora)")
+    parser.add_argument("--emergencias", type=float, default=0.1, help="proporción de emergencias (0 a 1)")
+    parser.add_argument("--distribucion", choices=["exponencial", "lognormal", "fija"], default="lognormal",
+                        help="distribución de los tiempos de atención")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--medir-arranque", type=int, metavar="REPETICIONES", nargs="?", const=10,
+                        help="medir el arranque en frío del núcleo y de la aplicación por separado")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    
+    # Con "is not None" un 0 no cae por error a abrir la interfaz
+    if args.medir_arranque is not None and args.medir_arranque < 1:
+        parser.error("--medir-arranque necesita al menos 1 repetición")
+    if args.simular_prioridad is not None and args.simular_prioridad < 1:
+        parser.error("--simular-prioridad necesita al menos 1 paciente")
+    
+    if args.medir_arranque is not None:
+        from .arranque import medir_arranque
+        medir_arranque(args.medir_arranque)
+        return
+    
+    if args.simular_prioridad is not None:
+        from .simulacion import mostrar_simulacion_planificador
+        mostrar_simulacion_planificador(args.simular_prioridad)
+        return
+    
+    from .nucleo import ListaEnlazadaTurnos
+    from .prioridad import ColaPrioridadTurnos
+    
+    if args.simular_carga:
+        from .simulacion import ConfiguracionSimulacion, mostrar_simulacion_carga
+        # ConfiguracionSimulacion valida los parámetros; acá solo convierto el error en un mensaje de uso
+        try:
+            config = ConfiguracionSimulacion(dias=args.dias, mostradores=args.mostradores,
+                                             medicos=min(args.medicos),
+                                             llegadas_por_hora=args.llegadas_por_hora,
+                                             proporcion_emergencias=args.emergencias,
+                                             distribucion_atencion=args.distribucion, semilla=args.semilla)
+        except ValueError as error:
+            parser.error(str(error))
+        mostrar_simulacion_carga(config, args.medicos, ColaPrioridadTurnos if args.prioridad else ListaEnlazadaTurnos)
+        return
+    
+    # Recién acá cargo tkinter: la interfaz solo se construye si realmente se va a mostrar
+    import tkinter as tk
+    from .interfaz import GestorTurnosApp
+    
+    # Creo la ventana principal y la aplicación
+    root = tk.Tk()
+    app = GestorTurnosApp(root, ColaPrioridadTurnos() if args.prioridad else None)
+    
+    # Inicio el loop principal que mantiene la aplicación corriendo
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
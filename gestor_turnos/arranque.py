@@ -0,0 +1,54 @@
+"""Medición del tiempo de arranque en frío del núcleo y de la aplicación"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+# subprocess -> cada medición corre en un intérprete nuevo, así nada queda importado de antes
+
+# Carpeta que contiene al paquete: los intérpretes nuevos corren ahí para poder importarlo
+# aunque el script se haya lanzado desde otro directorio
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Código que corre cada intérprete nuevo. La base ("python vacío") se resta al resto.
+ESCENARIOS = {
+    "python vacío": "pass",
+    "núcleo (import gestor_turnos)": "import gestor_turnos, sys; assert 'tkinter' not in sys.modules",
+    "interfaz (import gestor_turnos.interfaz)": "import gestor_turnos.interfaz",
+    "aplicación (ventana creada)": (
+        "import tkinter as tk\n"
+        "from gestor_turnos.interfaz import GestorTurnosApp\n"
+        "root = tk.Tk(); root.withdraw(); GestorTurnosApp(root); root.update_idletasks(); root.destroy()"
+    ),
+}
+
+def medir_escenario(codigo, repeticiones):
+    """Devolver (tiempos en ms, None) o (None, error) de correr 'codigo' en intérpretes nuevos"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                                   cwd=RAIZ_PROYECTO)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        if resultado.returncode != 0:
+            # Por ejemplo, la aplicación no puede abrir una ventana sin pantalla
+            return None, resultado.stderr.strip()
+    return tiempos, None
+
+def medir_arranque(repeticiones=10):
+    """Imprimir la mediana del arranque en frío de cada escenario"""
+    print(f"Arranque en frío ({repeticiones} repeticiones, mediana en ms)")
+    base = None
+    for nombre, codigo in ESCENARIOS.items():
+        tiempos, error = medir_escenario(codigo, repeticiones)
+        if tiempos is None:
+            # Muestro la última línea del error del intérprete hijo en vez de adivinar la causa
+            ultima_linea = error.splitlines()[-1] if error else "sin mensaje de error"
+            print(f"  {nombre:<42} no disponible: {ultima_linea}")
+            continue
+        mediana = statistics.median(tiempos)
+        if base is None:
+            base = mediana
+            print(f"  {nombre:<42} {mediana:8.1f}")
+        else:
+            print(f"  {nombre:<42} {mediana:8.1f}   (+{mediana - base:.1f} sobre python vacío)")
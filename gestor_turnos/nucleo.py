@@ -0,0 +1,188 @@
+"""Núcleo de la cola de turnos: nodos y lista enlazada (sin dependencias de la interfaz)"""
+from datetime import datetime
+# datetime -> para manejar fecha y hora actual
+
+class Nodo:
+    """Clase para crear cada nodo de mi lista enlazada de turnos"""
+    def __init__(self, paciente, telefono, fecha, hora, especialidad, es_emergencia=False,
+                 nivel_triage=None, hora_registro=None):
+        # Constructor del nodo - cada paciente será un nodo en mi lista
+        self.paciente = paciente                # Nombre del paciente
+        self.telefono = telefono                # Teléfono de contacto
+        self.fecha = fecha                      # Fecha del turno
+        self.hora = hora                        # Hora del turno
+        self.especialidad = especialidad        # Especialidad médica
+        self.es_emergencia = es_emergencia      # Boolean: True si es emergencia
+        self.nivel_triage = nivel_triage        # Nivel de triage 1 (más urgente) a 5 - solo lo usa el planificador por prioridad
+        # Momento exacto en que se registró (para calcular tiempo de espera)
+        self.hora_registro = hora_registro if hora_registro is not None else datetime.now()
+        self.siguiente = None                   # Puntero al siguiente nodo (concepto clave de listas enlazadas)
+
+class ListaEnlazadaTurnos:
+    """Mi implementación de lista enlazada para gestionar los turnos médicos"""
+    # para este tipo de operaciones porque puedo insertar/eliminar en cualquier posición fácilmente
+    
+    def __init__(self, reloj=datetime.now):
+        self.cabeza = None      # Primer nodo de la lista (None significa lista vacía)
+        self.cola = None        # Último nodo de la lista (para agregar turnos normales sin recorrer todo)
+        self.ultima_emergencia = None   # Último nodo de emergencia (las emergencias siempre están al inicio)
+        self.tamaño = 0         # Contador para saber cuántos pacientes hay
+        self.reloj = reloj      # Función que da la hora actual (el simulador de carga usa un reloj simulado)
+    
+    def agregar_turno(self, paciente, telefono, fecha, hora, especialidad, es_emergencia=False):
+        """Agregar un nuevo turno, priorizando emergencias al inicio"""
+        # Creo un nuevo nodo con los datos del paciente
+        nuevo_nodo = Nodo(paciente, telefono, fecha, hora, especialidad, es_emergencia,
+                          hora_registro=self.reloj())
+        
+        if not self.cabeza:
+            # Lista vacía - el nuevo nodo se convierte en la cabeza
+            self.cabeza = nuevo_nodo
+            self.cola = nuevo_nodo
+        elif es_emergencia:
+            # Si es emergencia, debo ponerlo al principio o después de otras emergencias
+            if not self.ultima_emergencia:
+                # No hay emergencias en la cola, pongo el nuevo nodo al inicio
+                nuevo_nodo.siguiente = self.cabeza
+                self.cabeza = nuevo_nodo
+            else:
+                # Ya hay emergencias al inicio: inserto el nuevo nodo después de la última
+                # (guardo un puntero a la última emergencia, así no tengo que recorrer la lista)
+                nuevo_nodo.siguiente = self.ultima_emergencia.siguiente
+                self.ultima_emergencia.siguiente = nuevo_nodo
+                if not nuevo_nodo.siguiente:
+                    self.cola = nuevo_nodo      # Todos eran emergencias, el nuevo queda último
+        else:
+            # Turno normal - lo agrego al final de la lista usando el puntero a la cola
+            self.cola.siguiente = nuevo_nodo     # Enlazo el último nodo con el nuevo
+            self.cola = nuevo_nodo
+        
+        if es_emergencia:
+            self.ultima_emergencia = nuevo_nodo
+        self.tamaño += 1    # Incremento el contador
+    
+    def llamar_siguiente(self):
+        """Llamar al siguiente paciente (eliminar el primero de la lista)"""
+        # En una cola, siempre se atiende al primero (FIFO - First In, First Out)
+        if not self.cabeza:
+            return None     # Lista vacía
+        
+        # Guardo referencia al nodo que voy a eliminar
+        paciente_llamado = self.cabeza
+        # Muevo la cabeza al siguiente nodo
+        self.cabeza = self.cabeza.siguiente
+        self.actualizar_punteros(paciente_llamado, None)
+        self.tamaño -= 1
+        return paciente_llamado
+    
+    def actualizar_punteros(self, eliminado, anterior):
+        """Mantener cola y ultima_emergencia correctos después de eliminar un nodo"""
+        if eliminado is self.cola:
+            self.cola = anterior
+        if eliminado is self.ultima_emergencia:
+            # Las emergencias están todas juntas al inicio, así que la anterior (si hay) también lo es
+            self.ultima_emergencia = anterior
+    
+    def cancelar_turno(self, nombre_paciente):
+        """Cancelar turno por nombre del paciente - eliminar nodo específico"""
+        if not self.cabeza:
+            return False    # Lista vacía
+        
+        # Si el nodo a eliminar es el primero (la cabeza)
+        if self.cabeza.paciente.lower() == nombre_paciente.lower():
+            eliminado = self.cabeza
+            self.cabeza = self.cabeza.siguiente
+            self.actualizar_punteros(eliminado, None)
+            self.tamaño -= 1
+            return True
+        
+        # Si el nodo a eliminar está en otra posición
+        # Necesito mantener referencia al nodo anterior para poder "saltear" el nodo a eliminar
+        actual = self.cabeza
+        while actual.siguiente:
+            if actual.siguiente.paciente.lower() == nombre_paciente.lower():
+                # Encontré el nodo a eliminar, lo "salteo" en la cadena de enlaces
+                eliminado = actual.siguiente
+                actual.siguiente = eliminado.siguiente
+                self.actualizar_punteros(eliminado, actual)
+                self.tamaño -= 1
+                return True
+            actual = actual.siguiente
+        
+        return False    # No se encontró el paciente
+    
+    def buscar_paciente(self, nombre_paciente):
+        """Buscar paciente en la lista y devolver el nodo y su posición"""
+        actual = self.cabeza
+        posicion = 1
+        
+        # Recorro toda la lista buscando el paciente
+        while actual:
+            if actual.paciente.lower() == nombre_paciente.lower():
+                return (actual, posicion)       # Retorno tupla: (nodo, posición)
+            actual = actual.siguiente
+            posicion += 1
+        
+        return (None, -1)   # No encontrado
+    
+    def obtener_lista_completa(self):
+        """Convertir mi lista enlazada a una lista normal para mostrar en la interfaz"""
+        # Esta función recorre toda mi lista enlazada y crea un diccionario con los datos
+        # de cada paciente para mostrar en la tabla
+        turnos = []
+        actual = self.cabeza
+        posicion = 1
+        
+        while actual:
+            # Calculo el tiempo que lleva esperando este paciente
+            tiempo_espera = self.reloj() - actual.hora_registro
+            minutos_espera = int(tiempo_espera.total_seconds() / 60)
+            
+            # Creo un diccionario con todos los datos para la tabla
+            turnos.append({
+                'posicion': posicion,
+                'paciente': actual.paciente,
+                'telefono': actual.telefono,
+                'hora': actual.hora,
+                'especialidad': actual.especialidad,
+                'tipo': 'EMERGENCIA' if actual.es_emergencia else 'NORMAL',
+                'tiempo_espera': f"{minutos_espera} min"
+            })
+            actual = actual.siguiente
+            posicion += 1
+        
+        return turnos
+    
+    def obtener_estadisticas(self):
+        """Calcular estadísticas de la cola para mostrar en el panel"""
+        if not self.cabeza:
+            return {
+                'total': 0,
+                'emergencias': 0,
+                'normales': 0,
+                'tiempo_promedio': 0
+            }
+        
+        # Variables para acumular estadísticas
+        total = 0
+        emergencias = 0
+        tiempo_total = 0
+        actual = self.cabeza
+        
+        # Recorro toda la lista acumulando datos
+        while actual:
+            total += 1
+            if actual.es_emergencia:
+                emergencias += 1
+            
+            # Calculo tiempo de espera y lo acumulo
+            tiempo_espera = self.reloj() - actual.hora_registro
+            tiempo_total += tiempo_espera.total_seconds() / 60
+            actual = actual.siguiente
+        
+        return {
+            'total': total,
+            'emergencias': emergencias,
+            'normales': total - emergencias,
+            'tiempo_promedio': int(tiempo_total / total) if total > 0 else 0
+        }
@@ -0,0 +1,274 @@
+"""Planificador de turnos por niveles de triage con envejecimiento"""
+from datetime import datetime
+from bisect import bisect_left, bisect_right
+# bisect -> búsqueda binaria en listas ordenadas
+
+from .nucleo import Nodo
+
+# ---------------------------------------------------------------------------
+# Planificador por prioridad con niveles de triage y envejecimiento
+# ---------------------------------------------------------------------------
+# La lista enlazada solo tiene dos categorías (emergencia / normal). Cuando llegan
+# muchas emergencias seguidas, los turnos normales pueden quedar esperando para siempre.
+# Este planificador usa niveles de triage del 1 (más urgente) al 5 y "envejece" a los
+# pacientes: cada intervalo_envejecimiento minutos de espera equivalen a subir un nivel.
+# El envejecimiento solo reordena los niveles 2 a 5: el nivel 1 (emergencia) siempre se
+# atiende primero, si no una oleada de turnos viejos dejaría esperando a las emergencias.
+
+NIVELES_TRIAGE = (1, 2, 3, 4, 5)
+NIVEL_EMERGENCIA = 1        # Nivel que se asigna a un turno marcado como emergencia
+NIVEL_NORMAL = 4            # Nivel que se asigna a un turno normal sin triage explícito
+EPOCA = datetime(2000, 1, 1)    # Fecha de referencia para convertir horas de registro a segundos
+
+class ArbolFenwick:
+    """Árbol de Fenwick (árbol binario indexado) que puede crecer agregando elementos al final"""
+    # Lo uso para contar cuántos turnos siguen activos antes de una posición en O(log n)
+    
+    def __init__(self, valores=()):
+        self.arbol = [0] + list(valores)    # El índice 0 no se usa (el árbol arranca en 1)
+        # Construcción en O(n): cada nodo le pasa su suma a su "padre"
+        for i in range(1, len(self.arbol)):
+            padre = i + (i & -i)
+            if padre < len(self.arbol):
+                self.arbol[padre] += self.arbol[i]
+    
+    def agregar(self, valor=1):
+        """Agregar un elemento al final del árbol - O(log n)"""
+        i = len(self.arbol)
+        # El nodo i cubre el rango (i - lowbit(i), i], así que guarda la suma de ese rango
+        self.arbol.append(valor + self.suma_prefijo(i - 1) - self.suma_prefijo(i - (i & -i)))
+    
+    def actualizar(self, i, delta):
+        """Sumar delta al elemento i (empezando en 1)"""
+        while i < len(self.arbol):
+            self.arbol[i] += delta
+            i += i & -i
+    
+    def suma_prefijo(self, i):
+        """Suma de los elementos 1..i"""
+        total = 0
+        while i > 0:
+            total += self.arbol[i]
+            i -= i & -i
+        return total
+
+class NivelTriage:
+    """Cola FIFO de un nivel de triage con claves crecientes (un "balde" del planificador)"""
+    
+    def __init__(self):
+        self.claves = []            # Claves de prioridad en orden de llegada (siempre crecientes)
+        self.nodos = []             # Nodos en el mismo orden que las claves
+        self.activos = ArbolFenwick()   # 1 si el turno sigue en la cola, 0 si ya fue llamado o cancelado
+        self.inicio = 0             # Índice del primer nodo que puede seguir activo
+        self.cantidad = 0           # Cuántos turnos activos hay en este nivel
+    
+    def frente(self):
+        """Devolver el primer nodo activo del nivel (o None)"""
+        # Los nodos llamados o cancelados se saltean acá (borrado perezoso)
+        while self.inicio < len(self.nodos) and not self.nodos[self.inicio].activo:
+            self.inicio += 1
+        return self.nodos[self.inicio] if self.inicio < len(self.nodos) else None
+    
+    def agregar(self, nodo):
+        """Agregar un nodo al final del nivel"""
+        nodo.indice = len(self.nodos) + 1   # Posición dentro del nivel (empieza en 1 como el árbol)
+        self.claves.append(nodo.clave)
+        self.nodos.append(nodo)
+        self.activos.agregar(1)
+        self.cantidad += 1
+    
+    def quitar(self, nodo):
+        """Marcar un nodo como inactivo y compactar si hay demasiados inactivos"""
+        nodo.activo = False
+        self.activos.actualizar(nodo.indice, -1)
+        self.cantidad -= 1
+        # Si más de la mitad de las entradas ya no sirven, reconstruyo el nivel (costo amortizado O(1))
+        if len(self.nodos) > 64 and self.cantidad * 2 < len(self.nodos):
+            self.compactar()
+    
+    def compactar(self):
+        """Eliminar los nodos inactivos y reconstruir los índices"""
+        self.nodos = [nodo for nodo in self.nodos if nodo.activo]
+        self.claves = [nodo.clave for nodo in self.nodos]
+        for indice, nodo in enumerate(self.nodos, start=1):
+            nodo.indice = indice
+        self.activos = ArbolFenwick([1] * len(self.nodos))
+        self.inicio = 0
+    
+    def contar_antes(self, clave, incluir_iguales):
+        """Cuántos turnos activos de este nivel tienen una clave menor (o igual) a la dada"""
+        if incluir_iguales:
+            limite = bisect_right(self.claves, clave)
+        else:
+            limite = bisect_left(self.claves, clave)
+        return self.activos.suma_prefijo(limite)
+
+class ColaPrioridadTurnos:
+    """Planificador de turnos por nivel de triage (1-5) con envejecimiento por tiempo de espera"""
+    # Tiene los mismos métodos que ListaEnlazadaTurnos, así la interfaz puede usar cualquiera de los dos.
+    #
+    # Regla 1: el nivel 1 (emergencia) va siempre primero, en orden de llegada. El envejecimiento
+    # nunca pone a otro paciente delante de una emergencia.
+    #
+    # Regla 2: entre los niveles 2 a 5 uso envejecimiento lineal. La prioridad efectiva es
+    #     nivel - espera / intervalo
+    # y al comparar dos pacientes en el mismo instante eso equivale a comparar
+    #     nivel * intervalo + hora_registro
+    # que NO cambia con el tiempo. Así que cada nivel es una cola FIFO con claves crecientes
+    # y el siguiente paciente es el frente del nivel 1 o, si está vacío, el menor de los otros
+    # 4 frentes: llamar_siguiente es O(1) + O(log n) para actualizar el árbol de Fenwick, y la
+    # posición de un paciente se calcula con una búsqueda binaria + árbol de Fenwick por nivel.
+    
+    def __init__(self, intervalo_envejecimiento=30, reloj=datetime.now):
+        # intervalo_envejecimiento: minutos de espera que equivalen a subir un nivel (None = sin envejecimiento)
+        # reloj: función que devuelve la hora actual (el simulador le pasa un reloj simulado)
+        self.intervalo_envejecimiento = intervalo_envejecimiento
+        self.reloj = reloj
+        self.niveles = {nivel: NivelTriage() for nivel in NIVELES_TRIAGE}
+        self.por_nombre = {}        # nombre en minúsculas -> lista de nodos activos con ese nombre
+        self.tamaño = 0
+    
+    @property
+    def cabeza(self):
+        """Próximo paciente a atender (sin sacarlo de la cola)"""
+        emergencia = self.niveles[NIVEL_EMERGENCIA].frente()
+        if emergencia:
+            return emergencia       # Las emergencias no compiten con los turnos envejecidos
+        mejor = None
+        for nivel in NIVELES_TRIAGE[1:]:
+            nodo = self.niveles[nivel].frente()
+            # Ante claves iguales gana el nivel más urgente (por eso comparo con < estricto)
+            if nodo and (mejor is None or nodo.clave < mejor.clave):
+                mejor = nodo
+        return mejor
+    
+    def calcular_clave(self, nivel, hora_registro):
+        """Clave de prioridad que no cambia con el tiempo (menor = se atiende antes)"""
+        segundos = (hora_registro - EPOCA).total_seconds()
+        if self.intervalo_envejecimiento is None:
+            return (nivel, segundos)        # Sin envejecimiento: primero el nivel, después el orden de llegada
+        return nivel * self.intervalo_envejecimiento * 60 + segundos
+    
+    def agregar_turno(self, paciente, telefono, fecha, hora, especialidad, es_emergencia=False, nivel_triage=None):
+        """Agregar un nuevo turno en el nivel de triage que corresponda"""
+        if nivel_triage is None:
+            nivel_triage = NIVEL_EMERGENCIA if es_emergencia else NIVEL_NORMAL
+        if nivel_triage not in NIVELES_TRIAGE:
+            raise ValueError(f"Nivel de triage inválido: {nivel_triage} (debe ser de 1 a 5)")
+        
+        nuevo_nodo = Nodo(paciente, telefono, fecha, hora, especialidad,
+                          es_emergencia or nivel_triage == NIVEL_EMERGENCIA, nivel_triage, self.reloj())
+        nivel = self.niveles[nivel_triage]
+        nuevo_nodo.clave = self.calcular_clave(nivel_triage, nuevo_nodo.hora_registro)
+        # Si el reloj retrocede (cambio de hora del sistema) mantengo el orden de llegada dentro del nivel
+        if nivel.claves and nuevo_nodo.clave < nivel.claves[-1]:
+            nuevo_nodo.clave = nivel.claves[-1]
+        nuevo_nodo.activo = True
+        
+        nivel.agregar(nuevo_nodo)
+        self.por_nombre.setdefault(nuevo_nodo.paciente.lower(), []).append(nuevo_nodo)
+        self.tamaño += 1
+        return nuevo_nodo
+    
+    def quitar_nodo(self, nodo):
+        """Sacar un nodo de la cola (lo usan llamar_siguiente y cancelar_turno)"""
+        self.niveles[nodo.nivel_triage].quitar(nodo)
+        mismos_nombre = self.por_nombre[nodo.paciente.lower()]
+        mismos_nombre.remove(nodo)
+        if not mismos_nombre:
+            del self.por_nombre[nodo.paciente.lower()]
+        self.tamaño -= 1
+    
+    def llamar_siguiente(self):
+        """Llamar al paciente con mayor prioridad efectiva"""
+        paciente_llamado = self.cabeza
+        if paciente_llamado:
+            self.quitar_nodo(paciente_llamado)
+        return paciente_llamado
+    
+    @staticmethod
+    def orden_de_atencion(nodo):
+        """Clave para ordenar nodos igual que llamar_siguiente (emergencias primero)"""
+        return (nodo.nivel_triage != NIVEL_EMERGENCIA, nodo.clave, nodo.nivel_triage)
+    
+    def primero_con_nombre(self, nombre_paciente):
+        """Devolver el turno más próximo a ser atendido con ese nombre (o None)"""
+        candidatos = self.por_nombre.get(nombre_paciente.lower())
+        if not candidatos:
+            return None
+        return min(candidatos, key=self.orden_de_atencion)
+    
+    def cancelar_turno(self, nombre_paciente):
+        """Cancelar turno por nombre del paciente"""
+        nodo = self.primero_con_nombre(nombre_paciente)
+        if not nodo:
+            return False
+        self.quitar_nodo(nodo)
+        return True
+    
+    def posicion_de(self, nodo):
+        """Calcular la posición en la cola de un nodo activo (empieza en 1)"""
+        if nodo.nivel_triage == NIVEL_EMERGENCIA:
+            # Una emergencia solo tiene delante a las emergencias que llegaron antes
+            return 1 + self.niveles[NIVEL_EMERGENCIA].activos.suma_prefijo(nodo.indice - 1)
+        
+        posicion = 1 + self.niveles[NIVEL_EMERGENCIA].cantidad     # Todas las emergencias van antes
+        for nivel in NIVELES_TRIAGE[1:]:
+            if nivel == nodo.nivel_triage:
+                # Mismo nivel: cuento los activos que llegaron antes
+                posicion += self.niveles[nivel].activos.suma_prefijo(nodo.indice - 1)
+            else:
+                # Niveles más urgentes le ganan en caso de empate, los menos urgentes no
+                posicion += self.niveles[nivel].contar_antes(nodo.clave, incluir_iguales=nivel < nodo.nivel_triage)
+        return posicion
+    
+    def buscar_paciente(self, nombre_paciente):
+        """Buscar paciente y devolver el nodo y su posición"""
+        nodo = self.primero_con_nombre(nombre_paciente)
+        if not nodo:
+            return (None, -1)
+        return (nodo, self.posicion_de(nodo))
+    
+    def recorrer_en_orden(self):
+        """Devolver todos los nodos activos en el orden en que serán atendidos"""
+        nodos = [nodo for nivel in NIVELES_TRIAGE for nodo in self.niveles[nivel].nodos if nodo.activo]
+        nodos.sort(key=self.orden_de_atencion)
+        return nodos
+    
+    def obtener_lista_completa(self):
+        """Convertir la cola a una lista normal para mostrar en la interfaz"""
+        ahora = self.reloj()
+        turnos = []
+        for posicion, nodo in enumerate(self.recorrer_en_orden(), start=1):
+            minutos_espera = int((ahora - nodo.hora_registro).total_seconds() / 60)
+            turnos.append({
+                'posicion': posicion,
+                'paciente': nodo.paciente,
+                'telefono': nodo.telefono,
+                'hora': nodo.hora,
+                'especialidad': nodo.especialidad,
+                'tipo': 'EMERGENCIA' if nodo.es_emergencia else 'NORMAL',
+                'triage': nodo.nivel_triage,
+                'tiempo_espera': f"{minutos_espera} min"
+            })
+        return turnos
+    
+    def obtener_estadisticas(self):
+        """Calcular estadísticas de la cola para mostrar en el panel"""
+        ahora = self.reloj()
+        emergencias = 0
+        tiempo_total = 0
+        for nivel in NIVELES_TRIAGE:
+            for nodo in self.niveles[nivel].nodos:
+                if nodo.activo:
+                    if nodo.es_emergencia:
+                        emergencias += 1
+                    tiempo_total += (ahora - nodo.hora_registro).total_seconds() / 60
+        
+        return {
+            'total': self.tamaño,
+            'emergencias': emergencias,
+            'normales': self.tamaño - emergencias,
+            'tiempo_promedio': int(tiempo_total / self.tamaño) if self.tamaño > 0 else 0,
+            'por_nivel': {nivel: self.niveles[nivel].cantidad for nivel in NIVELES_TRIAGE}
+        }
@@ -0,0 +1,466 @@
+"""Simuladores sin interfaz: planificador por prioridad y carga por eventos discretos"""
+from datetime import timedelta
+from collections import deque
+import copy
+import heapq
+import math
+import random
+import time
+# random y time -> para sortear llegadas y medir la latencia real de las operaciones
+# heapq, deque, math y copy -> para el simulador de carga por eventos discretos
+
+from .nucleo import ListaEnlazadaTurnos
+from .prioridad import ColaPrioridadTurnos, NIVELES_TRIAGE, EPOCA
+
+class RelojSimulado:
+    """Reloj que solo avanza cuando el simulador lo indica (reemplaza a datetime.now)"""
+    
+    def __init__(self, inicio=EPOCA):
+        self.ahora = inicio
+    
+    def __call__(self):
+        return self.ahora
+    
+    def avanzar_a(self, minutos):
+        """Poner el reloj en 'minutos' desde el inicio de la simulación"""
+        self.ahora = EPOCA + timedelta(minutes=minutos)
+
+def percentil(valores_ordenados, p):
+    """Percentil p (0-100) de una lista ya ordenada"""
+    if not valores_ordenados:
+        return 0
+    indice = min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p / 100))
+    return valores_ordenados[indice]
+
+class ListaEnEspera:
+    """Nombres de los pacientes que siguen en la cola, para elegir uno al azar en O(1)"""
+    
+    def __init__(self):
+        self.nombres = []
+        self.indices = {}       # nombre -> posición en self.nombres
+    
+    def agregar(self, nombre):
+        self.indices[nombre] = len(self.nombres)
+        self.nombres.append(nombre)
+    
+    def quitar(self, nombre):
+        # Muevo el último nombre al hueco, así no tengo que correr toda la lista
+        indice = self.indices.pop(nombre)
+        ultimo = self.nombres.pop()
+        if ultimo != nombre:
+            self.nombres[indice] = ultimo
+            self.indices[ultimo] = indice
+    
+    def elegir(self, azar):
+        return azar.choice(self.nombres)
+
+def resumir_latencias(latencias):
+    """Promedio y percentiles en microsegundos de cada operación (los valores vienen en ns)"""
+    resumen = {}
+    for operacion, valores in latencias.items():
+        valores.sort()
+        resumen[operacion] = {
+            'promedio': sum(valores) / len(valores) / 1000,
+            'p50': percentil(valores, 50) / 1000,
+            'p99': percentil(valores, 99) / 1000,
+            'max': valores[-1] / 1000
+        }
+    return resumen
+
+def medir_latencia_con_cola_grande(tamaño, intervalo_envejecimiento=30, operaciones=20_000, semilla=42):
+    """Medir las operaciones del planificador con 'tamaño' pacientes ya esperando en la cola"""
+    # En la simulación normal la cola casi nunca pasa de unos cientos de pacientes. Acá la precargo
+    # (como después de una oleada larga) y mido agregar + buscar + llamar manteniendo el tamaño fijo.
+    azar = random.Random(semilla)
+    reloj = RelojSimulado()
+    cola = ColaPrioridadTurnos(intervalo_envejecimiento, reloj)
+    en_espera = ListaEnEspera()
+    minuto = 0.0
+    
+    for numero in range(tamaño):
+        minuto += azar.expovariate(1.0)
+        reloj.avanzar_a(minuto)
+        cola.agregar_turno(f"Paciente {numero}", "0", "", "", "Medicina General",
+                           nivel_triage=azar.choice(NIVELES_TRIAGE))
+        en_espera.agregar(f"Paciente {numero}")
+    
+    latencias = {'agregar_turno': [], 'llamar_siguiente': [], 'buscar_paciente': []}
+    for numero in range(tamaño, tamaño + operaciones):
+        minuto += azar.expovariate(1.0)
+        reloj.avanzar_a(minuto)
+        nombre = f"Paciente {numero}"
+        nivel = azar.choice(NIVELES_TRIAGE)
+        inicio = time.perf_counter_ns()
+        cola.agregar_turno(nombre, "0", "", "", "Medicina General", nivel_triage=nivel)
+        latencias['agregar_turno'].append(time.perf_counter_ns() - inicio)
+        en_espera.agregar(nombre)
+        
+        nombre = en_espera.elegir(azar)
+        inicio = time.perf_counter_ns()
+        cola.buscar_paciente(nombre)
+        latencias['buscar_paciente'].append(time.perf_counter_ns() - inicio)
+        
+        inicio = time.perf_counter_ns()
+        nodo = cola.llamar_siguiente()
+        latencias['llamar_siguiente'].append(time.perf_counter_ns() - inicio)
+        en_espera.quitar(nodo.paciente)
+    return resumir_latencias(latencias)
+
+def simular_planificador(cantidad=100_000, intervalo_envejecimiento=30, minutos_por_consulta=1.0,
+                         ocupacion=0.98, semilla=42):
+    """Simular 'cantidad' pacientes con el planificador y devolver métricas de latencia y equidad"""
+    # Llegan pacientes (proceso de Poisson) y un consultorio los atiende. La ocupación cerca de 1
+    # más las oleadas de emergencias hacen que la cola crezca, que es cuando aparece la inanición.
+    # Cada llegada también hace una consulta de posición (buscar_paciente) de un paciente al azar
+    # que todavía está esperando (si no, la mayoría de las búsquedas no encontrarían a nadie).
+    azar = random.Random(semilla)
+    reloj = RelojSimulado()
+    cola = ColaPrioridadTurnos(intervalo_envejecimiento, reloj)
+    
+    # Distribución de niveles normal y durante una oleada de emergencias (1 hora de cada 8)
+    pesos_normales = [0.03, 0.07, 0.20, 0.40, 0.30]
+    pesos_oleada = [0.30, 0.30, 0.20, 0.10, 0.10]
+    
+    latencias = {'agregar_turno': [], 'llamar_siguiente': [], 'buscar_paciente': []}
+    esperas = {nivel: [] for nivel in NIVELES_TRIAGE}
+    tasa_llegada = ocupacion / minutos_por_consulta
+    en_espera = ListaEnEspera()
+    cola_max = 0
+    
+    def atender(minuto):
+        reloj.avanzar_a(minuto)
+        inicio = time.perf_counter_ns()
+        nodo = cola.llamar_siguiente()
+        latencias['llamar_siguiente'].append(time.perf_counter_ns() - inicio)
+        en_espera.quitar(nodo.paciente)
+        esperas[nodo.nivel_triage].append((reloj() - nodo.hora_registro).total_seconds() / 60)
+    
+    minuto = 0.0
+    proxima_atencion = 0.0
+    for i in range(cantidad):
+        minuto += azar.expovariate(tasa_llegada)
+        # Antes de la llegada, el consultorio atiende a todos los que le da el tiempo
+        while cola.tamaño and proxima_atencion <= minuto:
+            atender(proxima_atencion)
+            proxima_atencion += azar.expovariate(1 / minutos_por_consulta)
+        if not cola.tamaño:
+            proxima_atencion = max(proxima_atencion, minuto)    # El consultorio estaba libre
+        
+        reloj.avanzar_a(minuto)
+        pesos = pesos_oleada if (minuto // 60) % 8 == 0 else pesos_normales
+        nivel = azar.choices(NIVELES_TRIAGE, pesos)[0]
+        inicio = time.perf_counter_ns()
+        cola.agregar_turno(f"Paciente {i}", "0", "", "", "Medicina General", nivel_triage=nivel)
+        latencias['agregar_turno'].append(time.perf_counter_ns() - inicio)
+        en_espera.agregar(f"Paciente {i}")
+        cola_max = max(cola_max, cola.tamaño)
+        
+        nombre = en_espera.elegir(azar)
+        inicio = time.perf_counter_ns()
+        cola.buscar_paciente(nombre)
+        latencias['buscar_paciente'].append(time.perf_counter_ns() - inicio)
+    
+    # Al terminar las llegadas se atiende a los que quedaron en la cola
+    while cola.tamaño:
+        atender(proxima_atencion)
+        proxima_atencion += azar.expovariate(1 / minutos_por_consulta)
+    
+    resultado = {'latencias_us': resumir_latencias(latencias), 'esperas_min': {}, 'cola_max': cola_max}
+    promedios = []
+    for nivel, valores in esperas.items():
+        valores.sort()
+        promedio = sum(valores) / len(valores) if valores else 0
+        promedios.append(promedio)
+        resultado['esperas_min'][nivel] = {
+            'pacientes': len(valores),
+            'promedio': promedio,
+            'p95': percentil(valores, 95),
+            'max': valores[-1] if valores else 0
+        }
+    # Índice de Jain sobre la espera promedio de cada nivel: 1 = todos esperan lo mismo, 1/5 = muy desigual
+    cuadrados = sum(valor * valor for valor in promedios)
+    resultado['indice_jain'] = (sum(promedios) ** 2) / (len(promedios) * cuadrados) if cuadrados else 1.0
+    return resultado
+
+def mostrar_simulacion_planificador(cantidad=100_000):
+    """Imprimir la comparación sin envejecimiento vs con envejecimiento"""
+    for titulo, intervalo in (("SIN ENVEJECIMIENTO", None), ("CON ENVEJECIMIENTO (30 min por nivel)", 30)):
+        resultado = simular_planificador(cantidad, intervalo)
+        print(f"\n=== {titulo} - {cantidad} pacientes ===")
+        print("Latencia del planificador (microsegundos):")
+        for operacion, datos in resultado['latencias_us'].items():
+            print(f"  {operacion:<17} prom {datos['promedio']:7.2f}  p50 {datos['p50']:7.2f}  "
+                  f"p99 {datos['p99']:7.2f}  max {datos['max']:9.2f}")
+        print("Espera por nivel de triage (minutos):")
+        for nivel, datos in resultado['esperas_min'].items():
+            print(f"  nivel {nivel}: {datos['pacientes']:6d} pacientes  prom {datos['promedio']:8.1f}  "
+                  f"p95 {datos['p95']:8.1f}  max {datos['max']:8.1f}")
+        print(f"Índice de Jain entre niveles: {resultado['indice_jain']:.3f}")
+        print(f"Cola máxima durante la simulación: {resultado['cola_max']} pacientes")
+    
+    print("\n=== LATENCIA CON LA COLA YA LLENA (con envejecimiento, microsegundos) ===")
+    for tamaño in (1_000, 10_000, 50_000):
+        resumen = medir_latencia_con_cola_grande(tamaño)
+        for operacion, datos in resumen.items():
+            print(f"  cola {tamaño:>6}  {operacion:<17} prom {datos['promedio']:7.2f}  p50 {datos['p50']:7.2f}  "
+                  f"p99 {datos['p99']:7.2f}  max {datos['max']:9.2f}")
+
+# ---------------------------------------------------------------------------
+# Simulador de carga por eventos discretos (para planificar cuántos puestos hacen falta)
+# ---------------------------------------------------------------------------
+# En vez de esperar a que pase el tiempo real, el simulador guarda los eventos futuros
+# (llegadas y fines de atención) en un heap ordenado por minuto y salta de uno al otro.
+# Así se pueden simular días de tráfico en segundos usando la misma cola que la interfaz.
+
+# Llegadas por hora para cada hora del día (más gente a la mañana, casi nadie de noche)
+LLEGADAS_POR_HORA = [2, 1, 1, 1, 1, 2, 6, 14, 22, 26, 26, 24, 20, 18, 20, 22, 20, 16, 12, 9, 7, 5, 4, 3]
+
+# Proporción de pacientes por especialidad y minutos promedio de consulta de cada una
+MEZCLA_ESPECIALIDADES = {
+    "Medicina General": (0.40, 12),
+    "Cardiología": (0.12, 20),
+    "Dermatología": (0.10, 10),
+    "Neurología": (0.08, 25),
+    "Pediatría": (0.15, 15),
+    "Ginecología": (0.08, 18),
+    "Traumatología": (0.07, 20),
+}
+
+class ConfiguracionSimulacion:
+    """Parámetros de una corrida del simulador de carga"""
+    
+    def __init__(self, dias=7, mostradores=2, medicos=6, llegadas_por_hora=None, proporcion_emergencias=0.1,
+                 especialidades=None, distribucion_atencion="lognormal", minutos_registro=2.0,
+                 factor_emergencia=1.5, semilla=42):
+        self.dias = dias                                    # Días de tráfico a simular
+        self.mostradores = mostradores                      # Puestos de recepción que registran el turno
+        self.medicos = medicos                              # Médicos que llaman pacientes de la cola
+        self.llegadas_por_hora = llegadas_por_hora or LLEGADAS_POR_HORA  # 24 valores (o 1 para tasa fija)
+        self.proporcion_emergencias = proporcion_emergencias
+        self.especialidades = especialidades or MEZCLA_ESPECIALIDADES    # nombre -> (proporción, minutos promedio)
+        self.distribucion_atencion = distribucion_atencion  # "exponencial", "lognormal" o "fija"
+        self.minutos_registro = minutos_registro            # Tiempo promedio en el mostrador
+        self.factor_emergencia = factor_emergencia          # Las emergencias tardan más en el consultorio
+        self.semilla = semilla
+        self.validar()
+    
+    def validar(self):
+        """Revisar los parámetros: con valores inválidos la simulación dividiría por cero o no terminaría"""
+        if self.dias < 1:
+            raise ValueError(f"dias debe ser al menos 1 (se recibió {self.dias})")
+        if self.mostradores < 1:
+            raise ValueError(f"mostradores debe ser al menos 1 (se recibió {self.mostradores})")
+        if self.medicos < 1:
+            raise ValueError(f"medicos debe ser al menos 1 (se recibió {self.medicos})")
+        if len(self.llegadas_por_hora) not in (1, 24):
+            raise ValueError("llegadas_por_hora acepta un valor fijo o 24 valores (uno por hora)")
+        # Sin ninguna tasa positiva el proceso de llegadas nunca produciría un paciente
+        if min(self.llegadas_por_hora) < 0 or max(self.llegadas_por_hora) == 0:
+            raise ValueError("llegadas_por_hora: las tasas no pueden ser negativas y al menos una debe ser positiva")
+        if not 0 <= self.proporcion_emergencias <= 1:
+            raise ValueError("proporcion_emergencias debe estar entre 0 y 1")
+        if self.distribucion_atencion not in ("exponencial", "lognormal", "fija"):
+            raise ValueError(f"Distribución desconocida: {self.distribucion_atencion}")
+    
+    def con_medicos(self, medicos):
+        """Copia de la configuración con otra cantidad de médicos (la original no se modifica)"""
+        nueva = copy.copy(self)
+        nueva.medicos = medicos
+        nueva.validar()
+        return nueva
+
+def sortear_duracion(azar, promedio, distribucion):
+    """Sortear una duración en minutos con el promedio y la distribución pedidos"""
+    if distribucion == "fija":
+        return promedio
+    if distribucion == "exponencial":
+        return azar.expovariate(1 / promedio)
+    if distribucion == "lognormal":
+        # Con sigma = 0.5 la media de la lognormal es exp(mu + sigma²/2), despejo mu para que coincida
+        sigma = 0.5
+        return azar.lognormvariate(math.log(promedio) - sigma * sigma / 2, sigma)
+    raise ValueError(f"Distribución desconocida: {distribucion}")
+
+def proxima_llegada(azar, minuto, llegadas_por_hora):
+    """Minuto de la próxima llegada con un proceso de Poisson cuya tasa cambia cada hora"""
+    while True:
+        hora = int(minuto // 60)
+        tasa = llegadas_por_hora[hora % len(llegadas_por_hora)] / 60   # Llegadas por minuto
+        fin_hora = (hora + 1) * 60
+        if tasa > 0:
+            candidato = minuto + azar.expovariate(tasa)
+            if candidato < fin_hora:
+                return candidato
+        # No llegó nadie en lo que queda de esta hora: como el proceso no tiene memoria,
+        # vuelvo a sortear desde el comienzo de la hora siguiente con su propia tasa
+        minuto = fin_hora
+
+def resumir(valores):
+    """Promedio y percentiles de una lista de valores"""
+    valores = sorted(valores)
+    return {
+        'cantidad': len(valores),
+        'promedio': sum(valores) / len(valores) if valores else 0,
+        'p50': percentil(valores, 50),
+        'p90': percentil(valores, 90),
+        'p95': percentil(valores, 95),
+        'p99': percentil(valores, 99),
+        'max': valores[-1] if valores else 0
+    }
+
+def simular_carga(config, crear_cola=ListaEnlazadaTurnos):
+    """Correr la simulación por eventos discretos y devolver las métricas de la corrida"""
+    # Dos secuencias de números al azar independientes: una para las llegadas y los datos de cada
+    # paciente, otra para las duraciones. Además cada paciente sortea sus duraciones al llegar,
+    # así cambiar la cantidad de médicos o mostradores no cambia los pacientes que llegan ni
+    # cuánto tarda cada uno, y la comparación entre capacidades es justa.
+    azar_llegadas = random.Random(f"{config.semilla}-llegadas")
+    azar_duraciones = random.Random(f"{config.semilla}-duraciones")
+    reloj = RelojSimulado()
+    cola = crear_cola(reloj=reloj)      # La misma cola que usa la interfaz, pero con reloj simulado
+    
+    nombres = list(config.especialidades)
+    pesos = [config.especialidades[nombre][0] for nombre in nombres]
+    fin = config.dias * 24 * 60
+    
+    # Eventos: (minuto, orden, tipo, dato). El "orden" desempata eventos del mismo minuto
+    eventos = []
+    orden = 0
+    def programar(minuto, tipo, dato=None):
+        nonlocal orden
+        heapq.heappush(eventos, (minuto, orden, tipo, dato))
+        orden += 1
+    
+    espera_mostrador = deque()          # Pacientes que llegaron y esperan ser registrados
+    mostradores_libres = config.mostradores
+    medicos_libres = config.medicos
+    llegada_mostrador = {}              # id de paciente -> minuto en que llegó al centro
+    duracion_atencion = {}              # id de paciente -> minutos que va a estar en el consultorio
+    esperas = {'EMERGENCIA': [], 'NORMAL': [], 'mostrador': [], 'total': []}
+    tiempo_por_largo = {}               # largo de la cola -> minutos que estuvo con ese largo
+    minuto_anterior = 0.0
+    ocupacion_medicos = 0.0             # Minutos-médico de atención
+    llegados = 0
+    
+    def atender_si_se_puede(minuto):
+        nonlocal medicos_libres, ocupacion_medicos
+        while medicos_libres and cola.tamaño:
+            nodo = cola.llamar_siguiente()
+            medicos_libres -= 1
+            espera = (reloj() - nodo.hora_registro).total_seconds() / 60
+            esperas['EMERGENCIA' if nodo.es_emergencia else 'NORMAL'].append(espera)
+            esperas['total'].append(minuto - llegada_mostrador.pop(nodo.paciente))
+            duracion = duracion_atencion.pop(nodo.paciente)
+            ocupacion_medicos += min(duracion, fin - minuto)
+            programar(minuto + duracion, "fin_atencion")
+    
+    def registrar_si_se_puede(minuto):
+        nonlocal mostradores_libres
+        while mostradores_libres and espera_mostrador:
+            paciente = espera_mostrador.popleft()
+            mostradores_libres -= 1
+            esperas['mostrador'].append(minuto - llegada_mostrador[paciente[0]])
+            programar(minuto + paciente[3], "fin_registro", paciente)
+    
+    programar(proxima_llegada(azar_llegadas, 0.0, config.llegadas_por_hora), "llegada")
+    inicio_real = time.perf_counter()
+    cantidad_eventos = 0
+    
+    while eventos and eventos[0][0] <= fin:
+        minuto, _, tipo, dato = heapq.heappop(eventos)
+        cantidad_eventos += 1
+        # Acumulo cuánto tiempo estuvo la cola con el largo que tenía hasta ahora
+        tiempo_por_largo[cola.tamaño] = tiempo_por_largo.get(cola.tamaño, 0) + minuto - minuto_anterior
+        minuto_anterior = minuto
+        reloj.avanzar_a(minuto)
+        
+        if tipo == "llegada":
+            llegados += 1
+            nombre = f"Paciente {llegados}"
+            especialidad = azar_llegadas.choices(nombres, pesos)[0]
+            es_emergencia = azar_llegadas.random() < config.proporcion_emergencias
+            promedio = config.especialidades[especialidad][1]
+            if es_emergencia:
+                promedio *= config.factor_emergencia
+            # Tiempo en el mostrador y en el consultorio de este paciente
+            duracion_registro = sortear_duracion(azar_duraciones, config.minutos_registro,
+                                                 config.distribucion_atencion)
+            duracion_atencion[nombre] = sortear_duracion(azar_duraciones, promedio, config.distribucion_atencion)
+            paciente = (nombre, especialidad, es_emergencia, duracion_registro)
+            llegada_mostrador[nombre] = minuto
+            espera_mostrador.append(paciente)
+            programar(proxima_llegada(azar_llegadas, minuto, config.llegadas_por_hora), "llegada")
+            registrar_si_se_puede(minuto)
+        elif tipo == "fin_registro":
+            nombre, especialidad, es_emergencia, _ = dato
+            hora = reloj()
+            cola.agregar_turno(nombre, "0", hora.strftime("%d/%m/%Y"), hora.strftime("%H:%M"),
+                               especialidad, es_emergencia)
+            mostradores_libres += 1
+            registrar_si_se_puede(minuto)
+            atender_si_se_puede(minuto)
+        else:   # fin_atencion
+            medicos_libres += 1
+            atender_si_se_puede(minuto)
+    
+    tiempo_por_largo[cola.tamaño] = tiempo_por_largo.get(cola.tamaño, 0) + fin - minuto_anterior
+    segundos_reales = time.perf_counter() - inicio_real
+    
+    # Percentiles del largo de la cola ponderados por el tiempo que estuvo con cada largo
+    largos = {'promedio': sum(largo * minutos for largo, minutos in tiempo_por_largo.items()) / fin}
+    for nombre, p in (('p50', 50), ('p95', 95), ('p99', 99)):
+        acumulado = 0
+        for largo in sorted(tiempo_por_largo):
+            acumulado += tiempo_por_largo[largo]
+            if acumulado >= fin * p / 100:
+                largos[nombre] = largo
+                break
+    largos['max'] = max(tiempo_por_largo)
+    largos['final'] = cola.tamaño
+    
+    # Los que siguen esperando al final no se pueden descartar: justo en los casos saturados
+    # son los que más esperan. Cuento su espera hasta 'fin' (valor censurado, es un mínimo).
+    reloj.avanzar_a(fin)
+    atendidos = len(esperas['total'])
+    sin_atender = len(llegada_mostrador)
+    for paciente in espera_mostrador:
+        esperas['mostrador'].append(fin - llegada_mostrador[paciente[0]])
+    while cola.tamaño:
+        nodo = cola.llamar_siguiente()
+        esperas['EMERGENCIA' if nodo.es_emergencia else 'NORMAL'].append(
+            (reloj() - nodo.hora_registro).total_seconds() / 60)
+    # Incluye a los que todavía estaban en el mostrador (en la fila o registrándose)
+    for llegada in llegada_mostrador.values():
+        esperas['total'].append(fin - llegada)
+    
+    return {
+        'llegados': llegados,
+        'atendidos': atendidos,
+        'sin_atender': sin_atender,
+        'largo_cola': largos,
+        'espera_mostrador': resumir(esperas['mostrador']),
+        'espera_emergencia': resumir(esperas['EMERGENCIA']),
+        'espera_normal': resumir(esperas['NORMAL']),
+        'espera_total': resumir(esperas['total']),
+        'utilizacion_medicos': ocupacion_medicos / (config.medicos * fin),
+        'eventos': cantidad_eventos,
+        'segundos_reales': segundos_reales
+    }
+
+def mostrar_simulacion_carga(config, lista_medicos, crear_cola=ListaEnlazadaTurnos):
+    """Correr la simulación para cada cantidad de médicos e imprimir una tabla comparativa"""
+    print(f"\nSimulación de {config.dias} días - {config.mostradores} mostrador(es) - "
+          f"{config.proporcion_emergencias:.0%} emergencias - atención {config.distribucion_atencion}")
+    print(f"{'médicos':>7} {'utiliz':>7} {'cola prom':>9} {'cola p95':>8} {'cola max':>8} {'cola fin':>8} "
+          f"{'esp.mostr p95':>13} {'esp.emerg p95':>13} {'esp.normal p95':>14} {'esp.total p99':>13} "
+          f"{'sin atender':>11} {'eventos/s':>10}")
+    for medicos in lista_medicos:
+        r = simular_carga(config.con_medicos(medicos), crear_cola)
+        print(f"{medicos:>7} {r['utilizacion_medicos']:>7.0%} {r['largo_cola']['promedio']:>9.1f} "
+              f"{r['largo_cola']['p95']:>8} {r['largo_cola']['max']:>8} {r['largo_cola']['final']:>8} "
+              f"{r['espera_mostrador']['p95']:>13.1f} {r['espera_emergencia']['p95']:>13.1f} "
+              f"{r['espera_normal']['p95']:>14.1f} {r['espera_total']['p99']:>13.1f} "
+              f"{r['sin_atender']:>11} {r['eventos'] / r['segundos_reales']:>10.0f}")
+    print("(esperas en minutos; una 'cola fin' grande indica que la cola no se estabiliza con esa capacidad)")
+    print("('sin atender' = pacientes que seguían esperando al terminar; sus esperas se cuentan hasta el final\n"
+          " de la simulación, así que en esos casos los percentiles son un mínimo)")
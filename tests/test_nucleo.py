@@ -0,0 +1,59 @@
+"""Comparación aleatoria de ListaEnlazadaTurnos contra una lista de Python"""
+import random
+
+from gestor_turnos.nucleo import ListaEnlazadaTurnos
+
+def recorrer(lista):
+    """Devolver los nodos de la lista enlazada en orden"""
+    nodos = []
+    actual = lista.cabeza
+    while actual:
+        nodos.append(actual)
+        actual = actual.siguiente
+    return nodos
+
+def test_agregar_llamar_y_cancelar_coinciden_con_la_referencia():
+    azar = random.Random(7)
+    lista = ListaEnlazadaTurnos()
+    referencia = []     # (nombre, es_emergencia) en el orden en que se atienden
+    
+    for _ in range(5000):
+        operacion = azar.random()
+        # Pocos nombres distintos para que haya duplicados al cancelar
+        nombre = f"Paciente {azar.randrange(40)}"
+        if operacion < 0.5:
+            es_emergencia = azar.random() < 0.3
+            lista.agregar_turno(nombre, "", "", "", "", es_emergencia)
+            # Una emergencia va después de las emergencias existentes, un turno normal al final
+            posicion = sum(1 for _, emergencia in referencia if emergencia) if es_emergencia else len(referencia)
+            referencia.insert(posicion, (nombre, es_emergencia))
+        elif operacion < 0.75:
+            nodo = lista.llamar_siguiente()
+            esperado = referencia.pop(0) if referencia else None
+            assert (nodo.paciente, nodo.es_emergencia) == esperado if nodo else esperado is None
+        else:
+            # Se cancela el primer turno con ese nombre (sin importar mayúsculas)
+            indice = next((i for i, (otro, _) in enumerate(referencia) if otro == nombre), None)
+            assert lista.cancelar_turno(nombre.upper()) == (indice is not None)
+            if indice is not None:
+                referencia.pop(indice)
+        
+        nodos = recorrer(lista)
+        assert [(nodo.paciente, nodo.es_emergencia) for nodo in nodos] == referencia
+        assert lista.tamaño == len(referencia)
+        assert lista.cola is (nodos[-1] if nodos else None)
+        # Las emergencias quedan todas juntas al inicio y ultima_emergencia apunta a la última
+        emergencias = [nodo for nodo in nodos if nodo.es_emergencia]
+        assert nodos[:len(emergencias)] == emergencias
+        assert lista.ultima_emergencia is (emergencias[-1] if emergencias else None)
+
+def test_buscar_paciente_devuelve_la_primera_posicion():
+    lista = ListaEnlazadaTurnos()
+    lista.agregar_turno("Ana", "", "", "", "")
+    lista.agregar_turno("Luis", "", "", "", "")
+    lista.agregar_turno("Ana", "", "", "", "", es_emergencia=True)
+    
+    nodo, posicion = lista.buscar_paciente("ana")
+    assert posicion == 1 and nodo.es_emergencia
+    assert lista.buscar_paciente("Luis")[1] == 3
+    assert lista.buscar_paciente("Nadie") == (None, -1)
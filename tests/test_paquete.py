@@ -0,0 +1,19 @@
+"""El núcleo del paquete tiene que poder importarse sin tkinter (máquinas sin pantalla)"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.mark.parametrize("importacion", [
+    "import gestor_turnos",
+    "import gestor_turnos.simulacion",
+    "from gestor_turnos import *",
+])
+def test_importar_el_nucleo_no_carga_tkinter(importacion):
+    # Intérprete nuevo: en este proceso otro test podría haber importado tkinter antes
+    codigo = f"{importacion}\nimport sys\nassert 'tkinter' not in sys.modules, sorted(sys.modules)"
+    resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, cwd=RAIZ_PROYECTO)
+    assert resultado.returncode == 0, resultado.stderr
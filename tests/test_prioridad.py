@@ -0,0 +1,92 @@
+"""Comparación aleatoria de ColaPrioridadTurnos contra un orden de referencia"""
+from datetime import timedelta
+import random
+
+import pytest
+
+from gestor_turnos.prioridad import ColaPrioridadTurnos, NIVELES_TRIAGE, NIVEL_EMERGENCIA
+from gestor_turnos.simulacion import RelojSimulado
+
+def orden_referencia(activos, ahora, intervalo):
+    """Ordenar los turnos a mano a partir de la hora de registro, sin usar las claves de la cola"""
+    # activos: lista de (orden de llegada, nodo). Reglas:
+    #  1. emergencias primero, por orden de llegada
+    #  2. el resto por prioridad efectiva nivel - espera / intervalo (menor = antes) en este instante;
+    #     sin envejecimiento, por nivel. Empates: gana el nivel más urgente y después el que llegó antes
+    def prioridad(llegada_y_nodo):
+        llegada, nodo = llegada_y_nodo
+        if nodo.nivel_triage == NIVEL_EMERGENCIA:
+            return (0, 0, 0, llegada)
+        if intervalo is None:
+            return (1, nodo.nivel_triage, nodo.nivel_triage, llegada)
+        # nivel - espera / intervalo multiplicado por el intervalo en microsegundos: mismo orden,
+        # pero con enteros exactos para que los empates sean empates de verdad
+        espera = (ahora - nodo.hora_registro) // timedelta(microseconds=1)
+        return (1, nodo.nivel_triage * intervalo * 60_000_000 - espera, nodo.nivel_triage, llegada)
+    return [nodo for _, nodo in sorted(activos, key=prioridad)]
+
+@pytest.mark.parametrize("intervalo", [None, 30, 5])
+def test_orden_y_posiciones_coinciden_con_la_referencia(intervalo):
+    azar = random.Random(intervalo or 0)
+    reloj = RelojSimulado()
+    cola = ColaPrioridadTurnos(intervalo, reloj)
+    activos = []        # (orden de llegada, nodo) llevados por el test, sin mirar adentro de la cola
+    minuto = 0.0
+    compactaciones = 0
+    
+    for paso in range(3000):
+        # Pasos exactos en binario (0, ½, 1 y 2 minutos): así hay empates de prioridad entre niveles
+        # que llegaron con intervalo * (diferencia de nivel) minutos de diferencia
+        minuto += azar.choice([0, 0.5, 1, 2])
+        reloj.avanzar_a(minuto)
+        operacion = azar.random()
+        if operacion < 0.5:
+            nodo = cola.agregar_turno(f"p{azar.randrange(400)}", "", "", "", "",
+                                      nivel_triage=azar.choice(NIVELES_TRIAGE))
+            activos.append((paso, nodo))
+        elif operacion < 0.75:
+            esperado = orden_referencia(activos, reloj(), intervalo)
+            llamado = cola.llamar_siguiente()
+            assert llamado is (esperado[0] if esperado else None)
+            activos = [(llegada, nodo) for llegada, nodo in activos if nodo is not llamado]
+        else:
+            # Se cancela el turno con ese nombre que está más cerca de ser atendido
+            nombre = f"p{azar.randrange(400)}"
+            esperado = next((nodo for nodo in orden_referencia(activos, reloj(), intervalo)
+                             if nodo.paciente == nombre), None)
+            antes = [len(cola.niveles[nivel].nodos) for nivel in NIVELES_TRIAGE]
+            assert cola.cancelar_turno(nombre) == (esperado is not None)
+            despues = [len(cola.niveles[nivel].nodos) for nivel in NIVELES_TRIAGE]
+            compactaciones += sum(1 for a, d in zip(antes, despues) if d < a)
+            activos = [(llegada, nodo) for llegada, nodo in activos if nodo is not esperado]
+        
+        esperado = orden_referencia(activos, reloj(), intervalo)
+        assert cola.tamaño == len(esperado)
+        assert cola.cabeza is (esperado[0] if esperado else None)
+        if paso % 25 == 0:
+            assert cola.recorrer_en_orden() == esperado
+            for posicion, nodo in enumerate(esperado, start=1):
+                assert cola.buscar_paciente(nodo.paciente)[0] is not None
+                assert cola.posicion_de(nodo) == posicion
+    
+    assert compactaciones > 0      # Se compactó al menos un nivel con más de 64 entradas
+
+def test_emergencia_nueva_va_antes_que_un_turno_envejecido():
+    reloj = RelojSimulado()
+    cola = ColaPrioridadTurnos(30, reloj)
+    cola.agregar_turno("Viejo", "", "", "", "", nivel_triage=4)
+    reloj.avanzar_a(600)        # 10 horas de espera: envejeció mucho más que 3 niveles
+    cola.agregar_turno("Urgente", "", "", "", "", nivel_triage=1)
+    
+    assert cola.buscar_paciente("Urgente")[1] == 1
+    assert cola.buscar_paciente("Viejo")[1] == 2
+    assert cola.llamar_siguiente().paciente == "Urgente"
+
+def test_envejecimiento_entre_niveles_2_a_5():
+    reloj = RelojSimulado()
+    cola = ColaPrioridadTurnos(30, reloj)
+    cola.agregar_turno("Viejo", "", "", "", "", nivel_triage=4)
+    reloj.avanzar_a(61)         # Más de 2 intervalos: ya le gana a un nivel 2 recién llegado
+    cola.agregar_turno("Nuevo", "", "", "", "", nivel_triage=2)
+    
+    assert cola.llamar_siguiente().paciente == "Viejo"
@@ -0,0 +1,49 @@
+"""Pruebas del simulador de carga por eventos discretos"""
+import pytest
+
+from gestor_turnos.simulacion import ConfiguracionSimulacion, mostrar_simulacion_carga, simular_carga
+
+def sin_tiempo_real(resultado):
+    """Sacar las métricas que dependen de la velocidad de la máquina"""
+    return {clave: valor for clave, valor in resultado.items() if clave != 'segundos_reales'}
+
+def test_misma_semilla_mismo_resultado():
+    primero = simular_carga(ConfiguracionSimulacion(dias=2, medicos=4, semilla=3))
+    segundo = simular_carga(ConfiguracionSimulacion(dias=2, medicos=4, semilla=3))
+    assert sin_tiempo_real(primero) == sin_tiempo_real(segundo)
+
+def test_los_mismos_pacientes_llegan_con_cualquier_capacidad():
+    llegados = {simular_carga(ConfiguracionSimulacion(dias=2, medicos=medicos))['llegados']
+                for medicos in (3, 6, 9)}
+    assert len(llegados) == 1
+
+def test_con_capacidad_de_sobra_casi_no_hay_espera():
+    config = ConfiguracionSimulacion(dias=1, mostradores=30, medicos=60, distribucion_atencion="fija")
+    resultado = simular_carga(config)
+    
+    assert resultado['espera_mostrador']['max'] == 0
+    assert resultado['espera_emergencia']['max'] == 0
+    assert resultado['espera_normal']['max'] == 0
+    # Lo único que tarda es el registro en el mostrador (2 minutos fijos)
+    assert abs(resultado['espera_total']['max'] - config.minutos_registro) < 1e-6
+
+@pytest.mark.parametrize("parametros", [
+    {'dias': 0},
+    {'mostradores': 0},
+    {'medicos': 0},
+    {'llegadas_por_hora': [10, 20, 30]},
+    {'llegadas_por_hora': [0]},
+    {'llegadas_por_hora': [-1]},
+    {'proporcion_emergencias': 1.5},
+    {'distribucion_atencion': "normal"},
+])
+def test_configuracion_invalida_lanza_value_error(parametros):
+    with pytest.raises(ValueError):
+        ConfiguracionSimulacion(**parametros)
+
+def test_mostrar_no_modifica_la_configuracion(capsys):
+    config = ConfiguracionSimulacion(dias=1, medicos=6)
+    mostrar_simulacion_carga(config, [3, 4])
+    assert config.medicos == 6
+    with pytest.raises(ValueError):
+        config.con_medicos(0)